@@ -1,6 +1,33 @@
 import asyncio
-import json
+try:
+    # orjson parses the small report/config dicts several times faster
+    # than the stdlib; fall back transparently when it is not installed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 import logging
+import socket
+from functools import lru_cache
+
+
+NUM_CHANNELS = 2
+
+
+@lru_cache(maxsize=128)
+def _encode_command(command):
+    # Fixed-topic polls ("report", "output", ...) dominate traffic, so
+    # cache the encoded command lines instead of re-joining per call.
+    return (" ".join(command)).strip().encode("utf-8") + b"\n"
+
+
+# value encoders for set_param, keyed on exact type: floats use
+# fixed-point notation (the firmware does not parse exponents),
+# strings pass through untouched, anything else falls back to str()
+_VALUE_ENCODERS = {
+    float: lambda value: f"{value:f}",
+    int: str,
+    str: lambda value: value,
+}
 
 
 class CommandError(Exception):
@@ -21,6 +48,11 @@ class AsyncioClient:
             await client.connect()
         """
         self._reader, self._writer = await asyncio.open_connection(host, port)
+        # Commands are small writes; without TCP_NODELAY Nagle's
+        # algorithm can delay them by tens of milliseconds.
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         await self._check_zero_limits()
 
     def connected(self):
@@ -41,41 +73,97 @@ class AsyncioClient:
 
     async def _check_zero_limits(self):
         output_report = await self.get_output()
-        for output_channel in output_report:
-            for limit in ["max_i_neg", "max_i_pos", "max_v"]:
-                if output_channel[limit] == 0.0:
-                    logging.warning(
-                        "`%s` limit is set to zero on channel %d",
-                        limit,
-                        output_channel["channel"],
-                    )
+        zeroed = [
+            (output_channel["channel"], limit)
+            for output_channel in output_report
+            for limit in ("max_i_neg", "max_i_pos", "max_v")
+            if output_channel[limit] == 0.0
+        ]
+        if zeroed:
+            # one structured warning instead of per-limit formatting on
+            # the connect path
+            logging.warning(
+                "Output limit(s) set to zero: %s",
+                "; ".join(f"`{limit}` on channel {ch}" for ch, limit in zeroed),
+            )
+
+    async def _read_line_unlocked(self):
+        # read 1 line, returned as bytes for the JSON parser.
+        # readuntil() frames the line inside the stream's own buffer,
+        # without readline()'s extra newline bookkeeping. Callers must
+        # hold _read_lock.
+        try:
+            return await self._reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # connection closed mid-line; hand back what arrived
+            return e.partial
 
     async def _read_line(self):
-        # read 1 line
         async with self._read_lock:
-            chunk = await self._reader.readline()
-        return chunk.decode("utf-8", errors="ignore")
+            return await self._read_line_unlocked()
 
-    async def _read_write(self, command):
-        self._writer.write(((" ".join(command)).strip() + "\n").encode("utf-8"))
-        await self._writer.drain()
+    async def _command(self, *command):
+        return (await self._pipeline(command))[0]
 
-        return await self._read_line()
+    async def _pipeline(self, *commands):
+        """Send several commands in a single write and read their
+        responses in order.
 
-    async def _command(self, *command):
-        line = await self._read_write(command)
+        The firmware answers each command with one JSON line, in the
+        order the commands were received, so batching the writes saves
+        one network round-trip per command.
 
-        response = json.loads(line)
-        if "error" in response:
-            raise CommandError(response["error"])
-        return response
+        The lock is held across the whole write+read exchange: a
+        concurrent command slipping in between two pipeline reads would
+        be answered with one of the pipeline's pending responses.
+        """
+        async with self._read_lock:
+            self._writer.writelines(
+                _encode_command(command) for command in commands
+            )
+            await self._writer.drain()
+
+            responses = []
+            error = None
+            for _ in commands:
+                response = json_loads(await self._read_line_unlocked())
+                # keep reading so the stream stays aligned with the
+                # command stream; the first error is raised once all
+                # responses are in
+                if error is None and "error" in response:
+                    error = response["error"]
+                responses.append(response)
+        if error is not None:
+            raise CommandError(error)
+        return responses
 
     async def _get_conf(self, topic):
-        result = [None, None]
+        result = [None] * NUM_CHANNELS
         for item in await self._command(topic):
-            result[int(item["channel"])] = item
+            result[item["channel"]] = item
         return result
 
+    async def get_all_conf(self, topics=("output", "pid", "b-p", "postfilter", "report")):
+        """Retrieve several configuration topics in one network round-trip
+
+        Returns a dict keyed by topic. Per-channel topics are formatted
+        as by the corresponding ``get_*`` method.
+
+        Example::
+            conf = await thermostat.get_all_conf()
+            print(conf["pid"][0]["target"])
+        """
+        responses = await self._pipeline(*((topic,) for topic in topics))
+        conf = {}
+        for topic, response in zip(topics, responses):
+            if isinstance(response, list):
+                result = [None] * NUM_CHANNELS
+                for item in response:
+                    result[item["channel"]] = item
+                response = result
+            conf[topic] = response
+        return conf
+
     async def get_output(self):
         """Retrieve output limits for the TEC
 
@@ -186,16 +274,17 @@ class AsyncioClient:
 
         See the firmware's README.md for a full list.
         """
-        if isinstance(value, float):
-            value = f"{value:f}"
-        if not isinstance(value, str):
-            value = str(value)
+        value = _VALUE_ENCODERS.get(type(value), str)(value)
         await self._command(topic, str(channel), field, value)
 
     async def power_up(self, channel, target):
         """Start closed-loop mode"""
-        await self.set_param("pid", channel, "target", value=target)
-        await self.set_param("output", channel, "pid")
+        if isinstance(target, float):
+            target = f"{target:f}"
+        await self._pipeline(
+            ("pid", str(channel), "target", str(target)),
+            ("output", str(channel), "pid"),
+        )
 
     async def save_config(self, channel=""):
         """Save current configuration to EEPROM"""
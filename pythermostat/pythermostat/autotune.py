@@ -3,8 +3,11 @@ import math
 import logging
 import time
 from collections import deque, namedtuple
+from itertools import islice
 from enum import Enum, auto
 
+import numpy as np
+
 from pythermostat.client import Client
 
 # Based on hirshmann pid-autotune libiary
@@ -62,6 +65,18 @@ def get_argparser():
     return parser
 
 
+# Kp/Ki/Kd divisors per tuning rule, frozen at module level so the
+# table is built once at import time
+_TUNING_RULES = (
+    ("ziegler-nichols", (0.6, 1.2, 0.075)),
+    ("tyreus-luyben", (0.4545, 0.2066, 0.07214)),
+    ("ciancone-marlin", (0.303, 0.1364, 0.0481)),
+    ("pessen-integral", (0.7, 1.75, 0.105)),
+    ("some-overshoot", (0.333, 0.667, 0.111)),
+    ("no-overshoot", (0.2, 0.4, 0.0667)),
+)
+
+
 class PIDAutotuneState(Enum):
     OFF = auto()
     RELAY_STEP_UP = auto()
@@ -71,26 +86,27 @@ class PIDAutotuneState(Enum):
     READY = auto()
 
 
+# states in which the autotuner is actively driving the output
+AUTOTUNE_ACTIVE_STATES = frozenset({
+    PIDAutotuneState.READY,
+    PIDAutotuneState.RELAY_STEP_UP,
+    PIDAutotuneState.RELAY_STEP_DOWN,
+})
+
+
 class PIDAutotune:
     PIDParams = namedtuple('PIDParams', ['Kp', 'Ki', 'Kd'])
 
     PEAK_AMPLITUDE_TOLERANCE = 0.05
 
-    _tuning_rules = {
-        "ziegler-nichols": [0.6, 1.2, 0.075],
-        "tyreus-luyben": [0.4545,  0.2066, 0.07214],
-        "ciancone-marlin": [0.303, 0.1364, 0.0481],
-        "pessen-integral": [0.7, 1.75, 0.105],
-        "some-overshoot": [0.333, 0.667,  0.111],
-        "no-overshoot": [0.2, 0.4,  0.0667]
-    }
+    _tuning_rules = dict(_TUNING_RULES)
 
     def __init__(self, setpoint, out_step=10, lookback=60,
                  noiseband=0.5, sampletime=1.2):
         if setpoint is None:
             raise ValueError('setpoint must be specified')
 
-        self._inputs = deque(maxlen=round(lookback / sampletime))
+        self._reset_inputs(round(lookback / sampletime))
         self._setpoint = setpoint
         self._outputstep = out_step
         self._noiseband = noiseband
@@ -99,6 +115,8 @@ class PIDAutotune:
         self._state = PIDAutotuneState.OFF
         self._peak_timestamps = deque(maxlen=5)
         self._peaks = deque(maxlen=5)
+        self._peak_diffs = deque(maxlen=4)
+        self._peak_diff_sum = 0
         self._output = 0
         self._last_run_timestamp = 0
         self._peak_type = 0
@@ -114,7 +132,16 @@ class PIDAutotune:
         self._out_max = step
         self._out_min = -step
         self._noiseband = noiseband
-        self._inputs = deque(maxlen=round(lookback / sampletime))
+        self._reset_inputs(round(lookback / sampletime))
+
+    def _reset_inputs(self, maxlen):
+        # Preallocated ring buffer over the lookback window, so that
+        # peak detection is a numpy reduction instead of a per-element
+        # Python comparison loop.
+        self._inputs = np.empty(max(maxlen, 1))
+        self._inputs_maxlen = maxlen
+        self._inputs_pos = 0
+        self._inputs_len = 0
 
     def set_ready(self):
         self._state = PIDAutotuneState.READY
@@ -142,10 +169,14 @@ class PIDAutotune:
             tuning_rule (str): Sets the rule which should be used to calculate
                 the parameters.
         """
-        divisors = self._tuning_rules[tuning_rule]
-        kp = self._Ku * divisors[0]
-        ki = divisors[1] * self._Ku / self._Pu
-        kd = divisors[2] * self._Ku * self._Pu
+        return self._params_from(self._tuning_rules[tuning_rule])
+
+    def _params_from(self, divisors):
+        ku = self._Ku
+        pu = self._Pu
+        kp = ku * divisors[0]
+        ki = divisors[1] * ku / pu
+        kd = divisors[2] * ku * pu
         return PIDAutotune.PIDParams(kp, ki, kd)
 
     def run(self, input_val, time_input):
@@ -190,18 +221,24 @@ class PIDAutotune:
         self._output = min(self._output, self._out_max)
         self._output = max(self._output, self._out_min)
 
-        # identify peaks
-        is_max = True
-        is_min = True
-
-        for val in self._inputs:
-            is_max = is_max and (input_val >= val)
-            is_min = is_min and (input_val <= val)
-
-        self._inputs.append(input_val)
+        # identify peaks: the input is a peak candidate if it is
+        # greater (smaller) than every sample in the lookback window
+        if self._inputs_len:
+            window = self._inputs[:self._inputs_len]
+            is_max = bool(input_val >= window.max())
+            is_min = bool(input_val <= window.min())
+        else:
+            is_max = True
+            is_min = True
+
+        if self._inputs_maxlen:
+            self._inputs[self._inputs_pos] = input_val
+            self._inputs_pos = (self._inputs_pos + 1) % self._inputs_maxlen
+            if self._inputs_len < self._inputs_maxlen:
+                self._inputs_len += 1
 
         # we don't trust the maxes or mins until the input array is full
-        if len(self._inputs) < self._inputs.maxlen:
+        if self._inputs_len < self._inputs_maxlen:
             return False
 
         # increment peak count and record peak time for maxima and minima
@@ -219,9 +256,16 @@ class PIDAutotune:
                 inflection = True
             self._peak_type = -1
 
-        # update peak times and values
+        # update peak times and values, maintaining a running sum of
+        # the differences between consecutive peaks
         if inflection:
             self._peak_count += 1
+            if self._peaks:
+                diff = abs(self._peaks[-1] - input_val)
+                if len(self._peak_diffs) == self._peak_diffs.maxlen:
+                    self._peak_diff_sum -= self._peak_diffs[0]
+                self._peak_diffs.append(diff)
+                self._peak_diff_sum += diff
             self._peaks.append(input_val)
             self._peak_timestamps.append(now)
             logging.debug('found peak: {0}'.format(input_val))
@@ -232,15 +276,13 @@ class PIDAutotune:
         self._induced_amplitude = 0
 
         if inflection and (self._peak_count > 4):
-            abs_max = self._peaks[-2]
-            abs_min = self._peaks[-2]
-            for i in range(0, len(self._peaks) - 2):
-                self._induced_amplitude += abs(self._peaks[i]
-                                               - self._peaks[i+1])
-                abs_max = max(self._peaks[i], abs_max)
-                abs_min = min(self._peaks[i], abs_min)
-
-            self._induced_amplitude /= 6.0
+            # the last peak pair is excluded from the amplitude, as in
+            # the original full re-scan
+            self._induced_amplitude = \
+                (self._peak_diff_sum - self._peak_diffs[-1]) / 6.0
+            n_older = len(self._peaks) - 1
+            abs_max = max(islice(self._peaks, n_older))
+            abs_min = min(islice(self._peaks, n_older))
 
             # check convergence criterion for amplitude of induced oscillation
             amplitude_dev = ((0.5 * (abs_max - abs_min)
@@ -275,8 +317,8 @@ class PIDAutotune:
             self._Pu = 0.5 * (period1 + period2) / 1000.0
             print('Pu: {0}'.format(self._Pu))
 
-            for rule in self._tuning_rules:
-                params = self.get_pid_parameters(rule)
+            for rule, divisors in _TUNING_RULES:
+                params = self._params_from(divisors)
                 print('rule: {0}'.format(rule))
                 print('Kp: {0}'.format(params.Kp))
                 print('Ki: {0}'.format(params.Ki))
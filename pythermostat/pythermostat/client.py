@@ -1,6 +1,33 @@
 import socket
-import json
+try:
+    # orjson parses the small report/config dicts several times faster
+    # than the stdlib; fall back transparently when it is not installed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+
+NUM_CHANNELS = 2
+
+
+@lru_cache(maxsize=128)
+def _encode_command(command):
+    # Fixed-topic polls ("report", "output", ...) dominate traffic, so
+    # cache the encoded command lines instead of re-joining per call.
+    return (" ".join(command) + "\n").encode('utf-8')
+
+
+# value encoders for set_param, keyed on exact type: floats use
+# fixed-point notation (the firmware does not parse exponents),
+# strings pass through untouched, anything else falls back to str()
+_VALUE_ENCODERS = {
+    float: lambda value: f"{value:f}",
+    int: str,
+    str: lambda value: value,
+}
 
 
 class CommandError(Exception):
@@ -9,7 +36,19 @@ class CommandError(Exception):
 class Client:
     def __init__(self, host="192.168.1.26", port=23, timeout=None):
         self._socket = socket.create_connection((host, port), timeout)
-        self._lines = [""]
+        # Commands are small writes; without TCP_NODELAY Nagle's
+        # algorithm can delay them by tens of milliseconds.
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # sessions are long-lived and mostly idle between polls; let the
+        # kernel probe the peer so dead connections surface as errors
+        # instead of hanging the next read
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._rxbuf = bytearray()
+        # reusable receive buffer so recv does not allocate a fresh
+        # bytes object per call
+        self._recv_buf = bytearray(8192)
+        self._recv_view = memoryview(self._recv_buf)
+        self._batch = None
         self._check_zero_limits()
 
     def disconnect(self):
@@ -18,39 +57,148 @@ class Client:
 
     def _check_zero_limits(self):
         output_report = self.get_output()
-        for output_channel in output_report:
-            for limit in ["max_i_neg", "max_i_pos", "max_v"]:
-                if output_channel[limit] == 0.0:
-                    logging.warning("`{}` limit is set to zero on channel {}".format(limit, output_channel["channel"]))
+        zeroed = [
+            (output_channel["channel"], limit)
+            for output_channel in output_report
+            for limit in ("max_i_neg", "max_i_pos", "max_v")
+            if output_channel[limit] == 0.0
+        ]
+        if zeroed:
+            # one structured warning instead of per-limit formatting on
+            # the connect path
+            logging.warning(
+                "Output limit(s) set to zero: %s",
+                "; ".join(f"`{limit}` on channel {ch}" for ch, limit in zeroed),
+            )
 
     def _read_line(self):
-        # read more lines
-        while len(self._lines) <= 1:
-            chunk = self._socket.recv(4096)
-            if not chunk:
+        # buffer incoming data until it contains a full line; the line
+        # is returned as bytes, since the JSON parser takes those
+        # directly and no other caller needs text
+        buf = self._rxbuf
+        scan = 0
+        while True:
+            end = buf.find(b"\n", scan)
+            if end >= 0:
+                line = bytes(buf[:end])
+                del buf[:end + 1]
+                return line
+            # no newline yet; remember how far we scanned so the next
+            # pass only examines freshly received bytes
+            scan = len(buf)
+            received = self._socket.recv_into(self._recv_view)
+            if not received:
                 return None
-            buf = self._lines[-1] + chunk.decode('utf-8', errors='ignore')
-            self._lines = buf.split("\n")
-
-        line = self._lines[0]
-        self._lines = self._lines[1:]
-        return line
+            buf += self._recv_view[:received]
 
     def _command(self, *command):
-        self._socket.sendall((" ".join(command) + "\n").encode('utf-8'))
+        cmd = _encode_command(command)
+        if self._batch is not None:
+            # deferred until the enclosing pipeline() context exits;
+            # no response is available yet
+            self._batch.append(cmd)
+            return None
+        self._socket.sendall(cmd)
 
         line = self._read_line()
-        response = json.loads(line)
+        response = json_loads(line)
         if "error" in response:
             raise CommandError(response["error"])
         return response
 
+    def _pipeline(self, *commands):
+        """Send several commands in a single write and read their
+        responses in order.
+
+        The firmware answers each command with one JSON line, in the
+        order the commands were received, so batching the writes saves
+        one network round-trip per command.
+        """
+        self._socket.sendall(
+            b"".join(_encode_command(command) for command in commands)
+        )
+        responses = []
+        error = None
+        for _ in commands:
+            response = json_loads(self._read_line())
+            # keep reading so the stream stays aligned with the command
+            # stream; the first error is raised once all responses are in
+            if error is None and "error" in response:
+                error = response["error"]
+            responses.append(response)
+        if error is not None:
+            raise CommandError(error)
+        return responses
+
+    @contextmanager
+    def pipeline(self):
+        """Batch commands issued in this context into a single write
+
+        Commands sent inside the context (e.g. through set_param) are
+        buffered, written in one send on exit, and their responses read
+        back in order. Commands that need their response, such as the
+        get_* methods, should not be used inside the context: they
+        return None. Contexts nest: an inner pipeline() (e.g. opened by
+        set_params or power_up) joins the already-open batch, and the
+        outermost context performs the send and drains the responses.
+
+        Example::
+            with thermostat.pipeline():
+                thermostat.set_param("pid", 0, "target", 20.0)
+                thermostat.set_param("output", 0, "pid")
+        """
+        if self._batch is not None:
+            # already inside a pipeline; leave the open batch in place
+            # so buffered commands are not discarded
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        except BaseException:
+            self._batch = None
+            raise
+        batch, self._batch = self._batch, None
+        if batch:
+            self._socket.sendall(b"".join(batch))
+            error = None
+            for _ in batch:
+                response = json_loads(self._read_line())
+                # keep reading so the stream stays aligned with the
+                # command stream; the first error is raised once all
+                # responses are in
+                if error is None and "error" in response:
+                    error = response["error"]
+            if error is not None:
+                raise CommandError(error)
+
     def _get_conf(self, topic):
-        result = [None, None]
+        result = [None] * NUM_CHANNELS
         for item in self._command(topic):
-            result[int(item["channel"])] = item
+            result[item["channel"]] = item
         return result
 
+    def get_all_conf(self, topics=("output", "pid", "b-p", "postfilter", "report")):
+        """Retrieve several configuration topics in one network round-trip
+
+        Returns a dict keyed by topic. Per-channel topics are formatted
+        as by the corresponding ``get_*`` method.
+
+        Example::
+            conf = thermostat.get_all_conf()
+            print(conf["pid"][0]["target"])
+        """
+        responses = self._pipeline(*((topic,) for topic in topics))
+        conf = {}
+        for topic, response in zip(topics, responses):
+            if isinstance(response, list):
+                result = [None] * NUM_CHANNELS
+                for item in response:
+                    result[item["channel"]] = item
+                response = result
+            conf[topic] = response
+        return conf
+
     def get_output(self):
         """Retrieve output limits for the TEC
 
@@ -135,6 +283,29 @@ class Client:
         """
         return self._get_conf("report")
 
+    def report_mode(self, window=8):
+        """Iterate over reports without sleeping between them
+
+        Keeps `window` report requests in flight so that a response is
+        always in transit while the previous one is being processed,
+        instead of paying one full network round-trip per report.
+        Yields the channel report lists as by get_report(). Break out of
+        the loop to stop reporting; the responses still in flight are
+        drained so that the connection stays usable.
+        """
+        self._socket.sendall(b"report\n" * window)
+        try:
+            while True:
+                line = self._read_line()
+                if line is None:
+                    return
+                yield json_loads(line)
+                self._socket.sendall(b"report\n")
+        finally:
+            for _ in range(window - 1):
+                if self._read_line() is None:
+                    break
+
     def get_ipv4(self):
         """Get the IPv4 settings of the Thermostat"""
         return self._command("ipv4")
@@ -159,16 +330,30 @@ class Client:
 
         See the firmware's README.md for a full list.
         """
-        if type(value) is float:
-            value = "{:f}".format(value)
-        if type(value) is not str:
-            value = str(value)
+        value = _VALUE_ENCODERS.get(type(value), str)(value)
         self._command(topic, str(channel), field, value)
 
+    def set_params(self, topic, channel, fields):
+        """Set several parameters on one topic in a single round trip
+
+        Equivalent to calling set_param for each (field, value) pair of
+        `fields`, but the commands are written in one send and their
+        acknowledgements read back together, so the network round-trip
+        is paid once per batch instead of once per field.
+
+        Example::
+            thermostat.set_params("output", 0, {"max_v": 2.0, "max_i_pos": 2.0})
+        """
+        with self.pipeline():
+            set_param = self.set_param
+            for field, value in fields.items():
+                set_param(topic, channel, field, value)
+
     def power_up(self, channel, target):
         """Start closed-loop mode"""
-        self.set_param("pid", channel, "target", value=target)
-        self.set_param("output", channel, "pid")
+        with self.pipeline():
+            self.set_param("pid", channel, "target", value=target)
+            self.set_param("output", channel, "pid")
 
     def save_config(self, channel=""):
         """Save current configuration to EEPROM"""
@@ -5,13 +5,18 @@ import logging
 import argparse
 import importlib.resources
 import signal
-import json
-from functools import partial
+try:
+    # orjson parses the parameter tree noticeably faster than the
+    # stdlib; fall back transparently when it is not installed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from functools import lru_cache, partial
 from PyQt6 import QtWidgets, QtGui, uic
 from PyQt6.QtCore import Qt, pyqtSlot
 import qasync
 from qasync import asyncSlot, asyncClose
-from pythermostat.autotune import PIDAutotuneState
+from pythermostat.autotune import AUTOTUNE_ACTIVE_STATES, PIDAutotuneState
 from pythermostat.gui.model.thermostat import Thermostat, ThermostatConnectionState
 from pythermostat.gui.model.pid_autotuner import PIDAutoTuner
 from pythermostat.gui.view.ctrl_panel import CtrlPanel
@@ -49,6 +54,14 @@ def get_argparser():
     return parser
 
 
+@lru_cache(maxsize=4)
+def _load_param_tree(path):
+    # memoized so re-instantiating the main window does not re-parse
+    # the file; reading bytes keeps orjson on its fast path
+    with open(path, "rb") as f:
+        return json_loads(f.read())["ctrl_panel"]
+
+
 class MainWindow(QtWidgets.QMainWindow):
     NUM_CHANNELS = 2
 
@@ -73,6 +86,9 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
         self.lastCurrSetpoint = [0.0 for i in range(self.NUM_CHANNELS)]
+        # channels currently autotuning, maintained incrementally from
+        # state-change events instead of rescanned per transition
+        self._autotuning = set()
         self.apply_all_settings_btns = [None for i in range(self.NUM_CHANNELS)]
 
         # Handlers for disconnections
@@ -92,38 +108,36 @@ class MainWindow(QtWidgets.QMainWindow):
         self._thermostat.connection_error.connect(handle_connection_error)
 
         # Control Panel
-        def get_ctrl_panel_config(args):
-            with open(args.param_tree, "r", encoding="utf-8") as f:
-                return json.load(f)["ctrl_panel"]
-
         self._ctrl_panel_view = CtrlPanel(
             self._thermostat,
             self._autotuners,
             self._info_box,
             [self.ch0_tree, self.ch1_tree],
-            get_ctrl_panel_config(args),
+            _load_param_tree(args.param_tree),
         )
 
+        # shared "pending changes" palette for the apply buttons
+        #TODO: dynamically change the paramter tree row's background based on if they are modified or not
+        apply_btn_palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(246, 211, 45))
+        brush.setStyle(Qt.BrushStyle.SolidPattern)
+        for color_group in (
+            QtGui.QPalette.ColorGroup.Active,
+            QtGui.QPalette.ColorGroup.Inactive,
+            QtGui.QPalette.ColorGroup.Disabled,
+        ):
+            apply_btn_palette.setBrush(color_group, QtGui.QPalette.ColorRole.Button, brush)
+
+        ch_tabs = (self.ch0_tab, self.ch1_tab)
+        ch_layouts = (self.verticalLayout_2, self.verticalLayout)
         for ch in range(self.NUM_CHANNELS):
-            vlch = f"_{ch+2}" if ch==0 else f"" 
-
-            palette = QtGui.QPalette() #TODO: dynamically change the paramter tree row's background based on if they are modified or not
-            brush = QtGui.QBrush(QtGui.QColor(246, 211, 45))
-            brush.setStyle(Qt.BrushStyle.SolidPattern)
-            palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
-            brush = QtGui.QBrush(QtGui.QColor(246, 211, 45))
-            brush.setStyle(Qt.BrushStyle.SolidPattern)
-            palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
-            brush = QtGui.QBrush(QtGui.QColor(246, 211, 45))
-            brush.setStyle(Qt.BrushStyle.SolidPattern)
-            palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
-
-            self.apply_all_settings_btns[ch] = QtWidgets.QPushButton(f"Apply All Changes {ch}", parent=getattr(self, f"ch{ch}_tab")) #what even is this bruh TT_TT
-            getattr(self, f"verticalLayout{vlch}").addWidget(self.apply_all_settings_btns[ch])
-            self.apply_all_settings_btns[ch].setPalette(palette)
-            self.apply_all_settings_btns[ch].setVisible(False)
+            btn = QtWidgets.QPushButton(f"Apply All Changes {ch}", parent=ch_tabs[ch])
+            self.apply_all_settings_btns[ch] = btn
+            ch_layouts[ch].addWidget(btn)
+            btn.setPalette(apply_btn_palette)
+            btn.setVisible(False)
             self._ctrl_panel_view.sigCachedChangedSetting.connect(partial(self.enableApplyAllSettingBtn, ch))
-            self.apply_all_settings_btns[ch].clicked.connect(partial(self.applyAllSettings, ch))
+            btn.clicked.connect(partial(self.applyAllSettings, ch))
 
         # Setting save menu
         self.tabWidget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -168,6 +182,7 @@ class MainWindow(QtWidgets.QMainWindow):
     @asyncSlot(bool)
     async def emergencyStop(self):
         for ch in range(self.NUM_CHANNELS):
+            self._ctrl_panel_view.ensure_channel(ch)
             self.lastCurrSetpoint[ch] = self._ctrl_panel_view.currentCurrent[ch]
             await self._ctrl_panel_view.apply_setting(self._ctrl_panel_view.params[ch].child("output", "control_method", "i_set"), ch, 0.0, {'topic': 'output', 'field': 'i_set'})
         self.emergency_stop_btn.setEnabled(False)
@@ -176,6 +191,7 @@ class MainWindow(QtWidgets.QMainWindow):
     @asyncSlot(bool)
     async def startBtnSlot(self):
         for ch in range(self.NUM_CHANNELS):
+            self._ctrl_panel_view.ensure_channel(ch)
             await self._ctrl_panel_view.apply_setting(self._ctrl_panel_view.params[ch].child("output", "control_method", "i_set"), ch, self.lastCurrSetpoint[ch], {'topic': 'output', 'field': 'i_set'})
         self.start_btn.setEnabled(False)
         self.emergency_stop_btn.setEnabled(True)
@@ -186,21 +202,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @asyncSlot(bool)
     async def applyAllSettings(self, btnch=0):
-        self.cachedChanges = self._ctrl_panel_view.cachedChanges
-        
-        for param in self.cachedChanges:
-            ch = self.cachedChanges[param][0]
-            if(ch != btnch):
-                continue
-            data = self.cachedChanges[param][1]
-            thermostat_param = self.cachedChanges[param][2]
+        cachedChanges = self._ctrl_panel_view.cachedChanges
+
+        applies = []
+        for param, data, thermostat_param in cachedChanges[btnch].values():
             if param.opts.get("suffix", None) == "mA":
                 data /= 1000  # Given in mA
             if not "pid_autotune" in param.opts:
-                await self._ctrl_panel_view.apply_setting(param, ch, data, thermostat_param)
+                applies.append(self._ctrl_panel_view.apply_setting(param, btnch, data, thermostat_param))
             else:
-                self._ctrl_panel_view.autotuners.set_params(param.opts["pid_autotune"], ch, param)
-        
+                self._ctrl_panel_view.autotuners.set_params(param.opts["pid_autotune"], btnch, param)
+
+        # submit all writes concurrently instead of one round-trip each
+        if applies:
+            await asyncio.gather(*applies)
+
         self._ctrl_panel_view.flushCachedSetting()
         self.apply_all_settings_btns[btnch].setVisible(False)
             
@@ -217,53 +233,61 @@ class MainWindow(QtWidgets.QMainWindow):
         except:
             pass
 
+    @staticmethod
+    def _set_enabled(widget, enabled):
+        # setEnabled triggers style recomputation and repaints even
+        # when nothing changed, so skip no-op transitions
+        if widget.isEnabled() != enabled:
+            widget.setEnabled(enabled)
+
     @pyqtSlot(ThermostatConnectionState)
     def _on_connection_state_changed(self, state):
-        self.graph_group.setEnabled(state == ThermostatConnectionState.CONNECTED)
-        self.thermostat_settings.setEnabled(
-            state == ThermostatConnectionState.CONNECTED
-        )
-        self.report_group.setEnabled(state == ThermostatConnectionState.CONNECTED)
-
-        match state:
-            case ThermostatConnectionState.CONNECTED:
-                self.connect_btn.setText("Disconnect")
-                self.status_lbl.setText(
-                    "Connected to Thermostat v"
-                    f"{self._thermostat.hw_rev['rev']['major']}."
-                    f"{self._thermostat.hw_rev['rev']['minor']}"
-                )
-
-            case ThermostatConnectionState.CONNECTING:
-                self.connect_btn.setText("Stop")
-                self.status_lbl.setText("Connecting...")
-
-            case ThermostatConnectionState.DISCONNECTED:
-                self.connect_btn.setText("Connect")
-                self.status_lbl.setText("Disconnected")
+        connected = state == ThermostatConnectionState.CONNECTED
+        # each enable/text write below invalidates styles and layout;
+        # suspend painting so the whole transition costs one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_enabled(self.graph_group, connected)
+            self._set_enabled(self.thermostat_settings, connected)
+            self._set_enabled(self.report_group, connected)
+
+            match state:
+                case ThermostatConnectionState.CONNECTED:
+                    self.connect_btn.setText("Disconnect")
+                    self.status_lbl.setText(
+                        "Connected to Thermostat v"
+                        f"{self._thermostat.hw_rev['rev']['major']}."
+                        f"{self._thermostat.hw_rev['rev']['minor']}"
+                    )
+
+                case ThermostatConnectionState.CONNECTING:
+                    self.connect_btn.setText("Stop")
+                    self.status_lbl.setText("Connecting...")
+
+                case ThermostatConnectionState.DISCONNECTED:
+                    self.connect_btn.setText("Connect")
+                    self.status_lbl.setText("Disconnected")
 
-        for ch in range(self.NUM_CHANNELS):
-            self.start_btn.setEnabled(state == ThermostatConnectionState.CONNECTED and self.lastCurrSetpoint[ch] == 0.0)
-            self.emergency_stop_btn.setEnabled(state == ThermostatConnectionState.CONNECTED and self.lastCurrSetpoint[ch] != 0.0)
+            for ch in range(self.NUM_CHANNELS):
+                self._set_enabled(self.start_btn, connected and self.lastCurrSetpoint[ch] == 0.0)
+                self._set_enabled(self.emergency_stop_btn, connected and self.lastCurrSetpoint[ch] != 0.0)
+        finally:
+            self.setUpdatesEnabled(True)
 
     @pyqtSlot(int, PIDAutotuneState)
-    def _on_pid_autotune_state_changed(self, _ch, _state):
-        autotuning_channels = []
-        for ch in range(self.NUM_CHANNELS):
-            if self._autotuners.get_state(ch) in {
-                PIDAutotuneState.READY,
-                PIDAutotuneState.RELAY_STEP_UP,
-                PIDAutotuneState.RELAY_STEP_DOWN,
-            }:
-                autotuning_channels.append(ch)
-
-        if len(autotuning_channels) == 0:
+    def _on_pid_autotune_state_changed(self, ch, state):
+        if state in AUTOTUNE_ACTIVE_STATES:
+            self._autotuning.add(ch)
+        else:
+            self._autotuning.discard(ch)
+
+        if not self._autotuning:
             self.background_task_lbl.setText("Ready.")
             self.loading_spinner.hide()
             self.loading_spinner.stop()
         else:
             self.background_task_lbl.setText(
-                f"Autotuning channel {autotuning_channels}..."
+                f"Autotuning channel {sorted(self._autotuning)}..."
             )
             self.loading_spinner.start()
             self.loading_spinner.show()
@@ -274,6 +298,7 @@ class MainWindow(QtWidgets.QMainWindow):
             case ThermostatConnectionState.DISCONNECTED:
                 self._connecting_task = asyncio.current_task()
                 self._thermostat.connection_state = ThermostatConnectionState.CONNECTING
+                self.connection_details_menu.ensure_built()
                 await self._thermostat.start_session(
                     host=self.connection_details_menu.host_set_line.text(),
                     port=self.connection_details_menu.port_set_spin.value(),
@@ -316,6 +341,7 @@ async def coro_main():
     main_window.show()
 
     if args.connect:
+        main_window.connection_details_menu.ensure_built()
         if args.host:
             main_window.connection_details_menu.host_set_line.setText(args.host)
         if args.port:
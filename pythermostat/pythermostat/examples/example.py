@@ -3,11 +3,12 @@ from pythermostat.client import Client
 
 thermostat = Client() #(host="localhost", port=6667)
 thermostat.set_param("b-p", 1, "t0", 20)
-print(thermostat.get_output())
-print(thermostat.get_pid())
-print(thermostat.get_output())
-print(thermostat.get_postfilter())
-print(thermostat.get_b_parameter())
+# fetch all config topics in a single round-trip
+conf = thermostat.get_all_conf(("output", "pid", "postfilter", "b-p"))
+print(conf["output"])
+print(conf["pid"])
+print(conf["postfilter"])
+print(conf["b-p"])
 while True:
     print(thermostat.get_report())
     time.sleep(0.05)
@@ -1,6 +1,6 @@
 from PyQt6.QtCore import QObject, pyqtSlot, pyqtSignal
 from qasync import asyncSlot
-from pythermostat.autotune import PIDAutotuneState, PIDAutotune
+from pythermostat.autotune import AUTOTUNE_ACTIVE_STATES, PIDAutotuneState, PIDAutotune
 
 
 class PIDAutoTuner(QObject):
@@ -18,6 +18,7 @@ class PIDAutoTuner(QObject):
         self.temp_swing = [1.5 for _ in range(num_of_channel)]
         self.lookback = [3.0 for _ in range(num_of_channel)]
         self.sampling_interval = [1 / 16.67 for _ in range(num_of_channel)]
+        self._last_time = [None for _ in range(num_of_channel)]
 
     def set_params(self, params_name, ch, val):
         getattr(self, params_name)[ch] = val
@@ -44,41 +45,45 @@ class PIDAutoTuner(QObject):
 
     @asyncSlot(list)
     async def tick(self, report):
-        for channel_report in report:
-            ch = channel_report["channel"]
-
+        # runs at the report rate; bind the loop invariants once
+        set_param = self._thermostat.set_param
+        autotuners = self.autotuners
+        # reports are delivered as channel-indexed lists, so the index
+        # is the channel number
+        for ch, channel_report in enumerate(report):
             self.sampling_interval[ch] = channel_report["interval"]
 
+            # a late poll can deliver the same report twice; feeding a
+            # stale sample to the autotuner only wastes work
+            if channel_report["time"] == self._last_time[ch]:
+                continue
+            self._last_time[ch] = channel_report["time"]
+
             # TODO: Skip when PID Autotune or emit error message if NTC is not connected
             if channel_report["temperature"] is None:
                 continue
 
-            match self.autotuners[ch].state():
-                case (
-                    PIDAutotuneState.READY
-                    | PIDAutotuneState.RELAY_STEP_UP
-                    | PIDAutotuneState.RELAY_STEP_DOWN
-                ):
-                    self.autotuners[ch].run(
-                        channel_report["temperature"], channel_report["time"]
-                    )
-                    await self._thermostat.set_param(
-                        "output", ch, "i_set", self.autotuners[ch].output()
-                    )
-                case PIDAutotuneState.SUCCEEDED:
-                    kp, ki, kd = self.autotuners[ch].get_pid_parameters("tyreus-luyben")
-                    self.autotuners[ch].set_off()
-                    self.autotune_state_changed.emit(ch, self.autotuners[ch].state())
+            autotuner = autotuners[ch]
+            state = autotuner.state()
+            if state in AUTOTUNE_ACTIVE_STATES:
+                autotuner.run(
+                    channel_report["temperature"], channel_report["time"]
+                )
+                await set_param(
+                    "output", ch, "i_set", autotuner.output()
+                )
+            elif state == PIDAutotuneState.SUCCEEDED:
+                kp, ki, kd = autotuner.get_pid_parameters("tyreus-luyben")
+                autotuner.set_off()
+                self.autotune_state_changed.emit(ch, autotuner.state())
 
-                    await self._thermostat.set_param("pid", ch, "kp", kp)
-                    await self._thermostat.set_param("pid", ch, "ki", ki)
-                    await self._thermostat.set_param("pid", ch, "kd", kd)
-                    await self._thermostat.set_param("output", ch, "pid")
+                await set_param("pid", ch, "kp", kp)
+                await set_param("pid", ch, "ki", ki)
+                await set_param("pid", ch, "kd", kd)
+                await set_param("output", ch, "pid")
 
-                    await self._thermostat.set_param(
-                        "pid", ch, "target", self.target_temp[ch]
-                    )
-                case PIDAutotuneState.FAILED:
-                    self.autotuners[ch].set_off()
-                    self.autotune_state_changed.emit(ch, self.autotuners[ch].state())
-                    await self._thermostat.set_param("output", ch, "i_set", 0)
+                await set_param("pid", ch, "target", self.target_temp[ch])
+            elif state == PIDAutotuneState.FAILED:
+                autotuner.set_off()
+                self.autotune_state_changed.emit(ch, autotuner.state())
+                await set_param("output", ch, "i_set", 0)
@@ -82,21 +82,15 @@ class Thermostat(QObject, metaclass=PropertyMeta):
             await asyncio.sleep(self._update_s)
 
     async def update_params(self):
-        (
-            self.fan,
-            self.output,
-            self.report,
-            self.pid,
-            self.thermistor,
-            self.postfilter,
-        ) = await asyncio.gather(
-            self._client.get_fan(),
-            self._client.get_output(),
-            self._client.get_report(),
-            self._client.get_pid(),
-            self._client.get_b_parameter(),
-            self._client.get_postfilter(),
+        conf = await self._client.get_all_conf(
+            ("fan", "output", "report", "pid", "b-p", "postfilter")
         )
+        self.fan = conf["fan"]
+        self.output = conf["output"]
+        self.report = conf["report"]
+        self.pid = conf["pid"]
+        self.thermistor = conf["b-p"]
+        self.postfilter = conf["postfilter"]
 
     def connected(self):
         return self._client.connected()
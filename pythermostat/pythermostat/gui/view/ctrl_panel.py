@@ -1,7 +1,8 @@
+import asyncio
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from types import MethodType
-from functools import partial
-from PyQt6 import QtWidgets
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QFont
 from PyQt6.QtCore import pyqtSignal, QObject, QSignalBlocker, pyqtSlot
 import pyqtgraph.parametertree.parameterTypes as pTypes
 from pyqtgraph.parametertree import (
@@ -10,10 +11,114 @@ from pyqtgraph.parametertree import (
     registerParameterItemType,
 )
 from pyqtgraph.widgets.SpinBox import SpinBox
+import pyqtgraph as pg
+from pyqtgraph import functions as fn
 from qasync import asyncSlot
 from pythermostat.autotune import PIDAutotuneState
 
 
+def _setTargetToMeasured(self):
+    self.setValue(self._readings_temperature.value())
+
+
+def _targetContextMenuEvent(self, ev):
+    # built lazily on first right-click and reused; rebuilding the
+    # standard menu allocates a QMenu and all its actions every time
+    if getattr(self, "_contextMenu", None) is None:
+        self._contextMenu = self.lineEdit().createStandardContextMenu()
+        self._contextMenu.addSeparator()
+        self._contextMenu.addAction(QAction("Step Up", self, triggered=self.stepUp))
+        self._contextMenu.addAction(QAction("Step Down", self, triggered=self.stepDown))
+        self._contextMenu.addSeparator()
+        self._contextMenu.addAction(QAction("Set To Measurement", self, triggered=self.setTargetToMeasured))
+    self._contextMenu.popup(ev.globalPos())
+
+
+def _ctrlMeth(param, control_method="constant_current"):
+    # children are partitioned by name once per parameter, so a method
+    # change toggles visibility without re-reading opts per child
+    children = getattr(param, "_children_by_name", None)
+    if children is None:
+        children = param._children_by_name = {
+            child.opts["name"]: child for child in param.children()
+        }
+    shown = children["i_set" if control_method == "constant_current" else "target"]
+    for child in children.values():
+        if child is shown:
+            child.show()
+        else:
+            child.hide()
+
+
+def _cache_rate_change(param, data, thermostat_param):
+    if data is None:
+        thermostat_param = dict(thermostat_param, field="off")
+        data = ""
+    return data, thermostat_param
+
+
+def _cache_control_method_change(param, data, thermostat_param):
+    if data == "constant_current":
+        thermostat_param = dict(thermostat_param, field="i_set")
+        data = param.child("i_set").value()
+    elif data == "temperature_pid":
+        data = ""
+    return data, thermostat_param
+
+
+# list-type parameters whose cached value needs rewriting before it is
+# sent to the thermostat, dispatched by name instead of a match over
+# (name, value) pairs on every change event
+_CACHE_SPECIAL_CASES = {
+    "rate": _cache_rate_change,
+    "control_method": _cache_control_method_change,
+}
+
+
+# per-path (scale, offset, round digits) applied to raw thermostat
+# values before they reach the tree: current fields are displayed in
+# mA and t0 is reported in Kelvin. Rounding sits below the spin boxes'
+# displayed resolution and quantizes away ADC noise in the last bits,
+# so the unchanged-value guards hit in steady state instead of
+# repainting jitter the user cannot see.
+_DISPLAY_CONVERSIONS = {
+    ("pid", "pid_output_clamping", "output_min"): (1000.0, 0.0, 3),
+    ("pid", "pid_output_clamping", "output_max"): (1000.0, 0.0, 3),
+    ("output", "control_method", "i_set"): (1000.0, 0.0, 3),
+    ("output", "limits", "max_i_pos"): (1000.0, 0.0, 3),
+    ("output", "limits", "max_i_neg"): (1000.0, 0.0, 3),
+    ("readings", "tec_i"): (1000.0, 0.0, 3),
+    ("readings", "temperature"): (1.0, 0.0, 4),
+    ("thermistor", "t0"): (1.0, -273.15, 4),
+}
+
+
+def _to_display(path, raw):
+    conversion = _DISPLAY_CONVERSIONS.get(path)
+    if conversion is None:
+        return raw
+    scale, offset, ndigits = conversion
+    return round(raw * scale + offset, ndigits)
+
+
+def _fast_opts(param):
+    # canonicalized (set_param spec, special-case handler, excludeCache,
+    # name) tuple, computed once per parameter and stashed on it so
+    # cacheChanges does not re-read opts per change event
+    opts = param.opts
+    handler = (
+        _CACHE_SPECIAL_CASES.get(param.name())
+        if opts.get("type") == "list"
+        else None
+    )
+    return (
+        opts.get("thermostat:set_param"),
+        handler,
+        opts.get("excludeCache", False),
+        param.name(),
+    )
+
+
 class CtrlPanel(QObject):
 
     sigCachedChangedSetting = pyqtSignal(bool)
@@ -34,70 +139,55 @@ class CtrlPanel(QObject):
         self.info_box = info_box
         self.trees_ui = trees_ui
         self.NUM_CHANNELS = len(trees_ui)
-        self._cachedChanges = {}
+        # pending changes, partitioned by channel and keyed by setting
+        # name so rapid re-edits of one setting overwrite in place:
+        # ch -> {name: (param, data, thermostat_param)}
+        self._cachedChanges = defaultdict(dict)
+        # reference counts of pending setting names, so membership
+        # tests do not scan the whole cache per telemetry tick
+        self._cachedNames = Counter()
         self._settingVisualUpdate = set()
+        # last title applied per (channel, path); autotune state
+        # transitions often map to the same title and need no repaint
+        self._last_titles = {}
+        # fonts for marking settings with pending changes, built once
+        # instead of copying and mutating a QFont per tree item
+        self._font_dirty = QFont()
+        self._font_dirty.setBold(True)
+        self._font_dirty.setUnderline(True)
+        self._font_clean = QFont()
         self._currentCurrent = [0.0 for i in range(self.NUM_CHANNELS)]
 
-        self.THERMOSTAT_PARAMETERS = [param_tree for i in range(self.NUM_CHANNELS)]
-
-        self.params = [
-            Parameter.create(
-                name=f"Thermostat Channel {ch} Parameters",
-                type="group",
-                value=ch,
-                children=self.THERMOSTAT_PARAMETERS[ch],
-            )
-            for ch in range(self.NUM_CHANNELS)
-        ]
-
-        for i, param in enumerate(self.params):
-            param.channel = i
-
-        def _setTargetToMeasured(self):
-            self.setValue(self._param.parent().parent().parent().child("readings", "temperature").value())
-
-        def _targetContextMenuEvent(self, ev):
-            self._stdMenu = QtWidgets.QLineEdit()
-            self._contextMenu = self._stdMenu.createStandardContextMenu()
-            self._contextMenu.addSeparator()
-            self._contextMenu.addAction(QAction("Step Up", self, triggered=self.stepUp))
-            self._contextMenu.addAction(QAction("Step Down", self, triggered=self.stepDown))
-            self._contextMenu.addSeparator()
-            self._contextMenu.addAction(QAction("Set To Measurement", self, triggered=self.setTargetToMeasured))
-            self._contextMenu.popup(ev.globalPos())
+        # channel trees are materialized lazily, the first time their
+        # tab is shown or telemetry arrives for the channel
+        self._param_tree_spec = param_tree
+        self.params = [None for _ in range(self.NUM_CHANNELS)]
+        # (channel, path) -> Parameter, resolved once so the telemetry
+        # handlers do not walk the tree with child() on every tick
+        self._param_cache = {}
 
         for i, tree in enumerate(self.trees_ui):
             tree.setHeaderHidden(True)
-            tree.setParameters(self.params[i], showTop=False)
-            self.params[i].setValue = self._setValue
-            self.params[i].sigTreeStateChanged.connect(self.cacheChanges)
-
-            for item in self.params[i].child("output", "control_method", "target").items:
-                setattr(item.widget, "_param", item.param)
-                item.widget.setTargetToMeasured = MethodType(_setTargetToMeasured, item.widget)
-                item.widget.contextMenuEvent = MethodType(_targetContextMenuEvent, item.widget)
 
-            self.params[i].child("pid", "pid_autotune", "run_pid").sigActivated.connect(
-                partial(self.pid_auto_tune_request, i)
+            def _showEvent(ev, ch=i, orig=tree.showEvent):
+                self.ensure_channel(ch)
+                orig(ev)
+
+            tree.showEvent = _showEvent
+
+        # coalesce high-rate telemetry signals to at most ~30 Hz so a
+        # fast report rate cannot pile tree updates up behind the Qt
+        # event loop; SignalProxy hands the arguments over as a tuple
+        self._signal_proxies = [
+            pg.SignalProxy(signal, rateLimit=30, slot=slot)
+            for signal, slot in (
+                (self.thermostat.pid_update, self.update_pid),
+                (self.thermostat.report_update, self.update_report),
+                (self.thermostat.thermistor_update, self.update_thermistor),
+                (self.thermostat.output_update, self.update_output),
+                (self.thermostat.postfilter_update, self.update_postfilter),
             )
-
-            def _ctrlMeth(param, control_method="constant_current"):
-                name = "i_set" if control_method == "constant_current" else "target"
-                for item in param.children():
-                    if item.opts["name"] == name:
-                        item.show()
-                    else:
-                        item.hide()
-
-            self.params[i].child("output", "control_method").sigValueChanged.connect(_ctrlMeth)
-            
-            _ctrlMeth(self.params[i].child("output", "control_method"))
-
-        self.thermostat.pid_update.connect(self.update_pid)
-        self.thermostat.report_update.connect(self.update_report)
-        self.thermostat.thermistor_update.connect(self.update_thermistor)
-        self.thermostat.output_update.connect(self.update_output)
-        self.thermostat.postfilter_update.connect(self.update_postfilter)
+        ]
         self.autotuners.autotune_state_changed.connect(self.update_pid_autotune)
 
     @property
@@ -108,6 +198,92 @@ class CtrlPanel(QObject):
     def currentCurrent(self):
         return self._currentCurrent
 
+    def ensure_channel(self, ch):
+        """Build the parameter tree for a channel on first use
+
+        Construction is deferred so startup only pays for the channels
+        that are actually shown or reporting.
+        """
+        if self.params[ch] is not None:
+            return
+        param = Parameter.create(
+            name=f"Thermostat Channel {ch} Parameters",
+            type="group",
+            value=ch,
+            children=self._param_tree_spec,
+        )
+        param.channel = ch
+        self.params[ch] = param
+
+        self.trees_ui[ch].setParameters(param, showTop=False)
+        param.setValue = self._setValue
+        param.sigTreeStateChanged.connect(self.cacheChanges)
+
+        # resolve the sibling reading once instead of chaining four
+        # parent()/child() calls on every "Set To Measurement" click
+        readings_temperature = param.child("readings", "temperature")
+        for item in param.child("output", "control_method", "target").items:
+            setattr(item.widget, "_param", item.param)
+            setattr(item.widget, "_readings_temperature", readings_temperature)
+            item.widget.setTargetToMeasured = MethodType(_setTargetToMeasured, item.widget)
+            item.widget.contextMenuEvent = MethodType(_targetContextMenuEvent, item.widget)
+
+        run_pid = param.child("pid", "pid_autotune", "run_pid")
+        run_pid.channel = ch
+        run_pid.sigActivated.connect(self._on_run_pid_activated)
+
+        param.child("output", "control_method").sigValueChanged.connect(_ctrlMeth)
+
+        _ctrlMeth(param.child("output", "control_method"))
+
+        self._cache_params(ch, param)
+
+    def _cache_params(self, ch, root):
+        # one iterative pass over the tree, accumulating paths as it
+        # goes, instead of a recursive walk with a frame per level
+        stack = [((), root)]
+        while stack:
+            path, node = stack.pop()
+            for child in node.children():
+                child_path = path + (child.name(),)
+                self._param_cache[(ch, child_path)] = child
+                stack.append((child_path, child))
+
+    def _p(self, ch, *path):
+        return self._param_cache[(ch, path)]
+
+    @contextmanager
+    def _signals_blocked(self, channels=()):
+        # materialize every channel the batch will touch before the
+        # blockers are snapshotted: a tree built mid-batch would get
+        # its first telemetry with signals live and cache it as user
+        # edits. Then block the whole batch of channels once instead
+        # of entering and leaving a QSignalBlocker per channel per
+        # handler, and suspend tree repaints so title and font changes
+        # made during the batch collapse into one repaint per tree
+        for ch in channels:
+            self.ensure_channel(ch)
+        blockers = [
+            QSignalBlocker(param) for param in self.params if param is not None
+        ]
+        for tree in self.trees_ui:
+            tree.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            for tree in self.trees_ui:
+                tree.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _setIfChanged(param, value):
+        # setValue round-trips through value interpretation, signal
+        # emission and a repaint even when nothing changed; on a
+        # steady-state thermostat most ticks report unchanged values
+        if not fn.eq(param.opts["value"], value):
+            param.setValue(value)
+
     def _setValue(self, value, blockSignal=None):
         """
         Implement 'lock' mechanism for Parameter Type
@@ -118,7 +294,13 @@ class CtrlPanel(QObject):
             if blockSignal is not None:
                 self.sigValueChanged.disconnect(blockSignal)
             value = self._interpretValue(value)
-            if fn.eq(self.opts["value"], value):
+            current = self.opts["value"]
+            # plain == suffices for the scalar types the tree stores;
+            # fall back to pyqtgraph's generic fn.eq otherwise
+            if type(current) is type(value) and isinstance(value, (int, float, str)):
+                if current == value:
+                    return value
+            elif fn.eq(current, value):
                 return value
 
             if "lock" in self.opts.keys():
@@ -135,35 +317,43 @@ class CtrlPanel(QObject):
         return self.opts["value"]
     
     def change_params_title(self, channel, path, title):
-        self.params[channel].child(*path).setOpts(title=title)
+        if self._last_titles.get((channel, path)) == title:
+            return
+        self._last_titles[(channel, path)] = title
+        self._p(channel, *path).setOpts(title=title)
 
     @asyncSlot(object, object)
     async def cacheChanges(self, param, changes):
         ch = param.channel
+        applies = []
         for inner_param, change_type, data in changes: 
             if change_type != "value":
                 continue
             
-            thermostat_param = inner_param.opts["thermostat:set_param"]
-            if inner_param.opts["type"] == "list":
-                match inner_param.name(), data:
-                    case "rate", None:
-                        thermostat_param = thermostat_param.copy()
-                        thermostat_param["field"] = "off"
-                        data = ""
-                    case "control_method", "constant_current":
-                        thermostat_param = thermostat_param.copy()
-                        thermostat_param["field"] = "i_set"
-                        data = inner_param.child("i_set").value()
-                    case "control_method", "temperature_pid":
-                        data = ""
-
-            if not inner_param.opts.get("excludeCache", False):
-                self._cachedChanges[inner_param] = (ch, data, thermostat_param) #TODO: Make slimmer
+            fast = getattr(inner_param, "_fast", None)
+            if fast is None:
+                fast = inner_param._fast = _fast_opts(inner_param)
+            thermostat_param, handler, exclude_cache, name = fast
+            if handler is not None:
+                data, thermostat_param = handler(
+                    inner_param, data, thermostat_param
+                )
+
+            if not exclude_cache:
+                if name not in self._cachedChanges[ch]:
+                    self._cachedNames[name] += 1
+                self._cachedChanges[ch][name] = (inner_param, data, thermostat_param)
                 self.sigCachedChangedSetting.emit(True)
                 continue
 
-            await self.apply_setting(inner_param, ch, data, thermostat_param)
+            applies.append(
+                self.apply_setting(inner_param, ch, data, thermostat_param)
+            )
+
+        # independent writes share the wire concurrently instead of
+        # paying one round-trip each
+        if applies:
+            await asyncio.gather(*applies)
 
     async def apply_setting(self, param, channel, data, thermostat_param):
         param.setOpts(lock=True)
@@ -171,17 +361,16 @@ class CtrlPanel(QObject):
         param.setOpts(lock=False)
 
     def _checkIsInCachedChanges(self, setting):
-        for param in self._cachedChanges:
-            if setting == param.opts["name"]:
-                return True
-        return False
+        return self._cachedNames[setting] > 0
 
     def flushCachedSetting(self):
         self._cachedChanges.clear()
+        self._cachedNames.clear()
 
     def _handleCachedSettings(self, ch, data, path):
         name = path[-1]
-        setting_param = self.params[ch].child(*path)
+        data = _to_display(path, data)
+        setting_param = self._p(ch, *path)
         isCachedSetting = self._checkIsInCachedChanges(name)
         isInSettingVisualUpdate = name in self._settingVisualUpdate
         match isCachedSetting, isInSettingVisualUpdate:
@@ -189,81 +378,111 @@ class CtrlPanel(QObject):
                 self._settingVisualUpdate.add(name)
                 setting_param.setOpts(title=setting_param.opts["title"] + " (*)")
                 for item in setting_param.items:
-                    font = item.font(0);font.setBold(True);font.setUnderline(True)
-                    item.setFont(0, font)
+                    item.setFont(0, self._font_dirty)
             case True, _: 
                 for item in setting_param.items:
                     item.setToolTip(1, f"Current value: {data}")
             case False, True:
-                setting_param.setValue(data)
+                self._setIfChanged(setting_param, data)
                 setting_param.setOpts(title=(setting_param.opts["title"])[0:-3])
                 for item in setting_param.items:
-                    font = item.font(0);font.setBold(False);font.setUnderline(False)
-                    item.setFont(0, font)
+                    item.setFont(0, self._font_clean)
                 self._settingVisualUpdate.discard(name)
             case False, False:
-                setting_param.setValue(data)
+                self._setIfChanged(setting_param, data)
 
 
-    @pyqtSlot(list)
-    def update_pid(self, pid_settings):
-        for settings in pid_settings:
-            channel = settings["channel"]
-            with QSignalBlocker(self.params[channel]):
+    @pyqtSlot(object)
+    def update_pid(self, args):
+        (pid_settings,) = args
+        with self._signals_blocked(s["channel"] for s in pid_settings):
+            for settings in pid_settings:
+                channel = settings["channel"]
                 for name in ["kp", "ki", "kd"]:
                     self._handleCachedSettings(channel, settings["parameters"][name], ("pid", name))
-                self._handleCachedSettings(channel, settings["parameters"]["output_min"]*1000, ("pid", "pid_output_clamping", "output_min"))
-                self._handleCachedSettings(channel, settings["parameters"]["output_max"]*1000, ("pid", "pid_output_clamping", "output_max"))
+                self._handleCachedSettings(channel, settings["parameters"]["output_min"], ("pid", "pid_output_clamping", "output_min"))
+                self._handleCachedSettings(channel, settings["parameters"]["output_max"], ("pid", "pid_output_clamping", "output_max"))
                 self._handleCachedSettings(channel, settings["target"], ("output", "control_method", "target"))
 
-    @pyqtSlot(list)
-    def update_report(self, report_data):
+    @staticmethod
+    def _prepare_report(report_data):
+        # pure-data pass: do the dict lookups and unit conversions up
+        # front so the Qt-facing loop below only touches widgets
+        prepared = []
         for settings in report_data:
-            channel = settings["channel"]
-            with QSignalBlocker(self.params[channel]):
-                self.params[channel].child("output", "control_method").setValue(
-                    "temperature_pid" if settings["pid_engaged"] else "constant_current"
-                )
-                self._currentCurrent[channel] = settings["i_set"]
-                self._handleCachedSettings(channel, settings["i_set"]*1000, ("output", "control_method", "i_set"))
-                if settings["temperature"] is not None:
-                    self.params[channel].child("readings", "temperature").setValue(
-                        settings["temperature"]
+            control_method = (
+                "temperature_pid" if settings["pid_engaged"] else "constant_current"
+            )
+            readings = []
+            if settings["temperature"] is not None:
+                readings.append(
+                    (
+                        ("readings", "temperature"),
+                        _to_display(
+                            ("readings", "temperature"), settings["temperature"]
+                        ),
                     )
-                    if settings["tec_i"] is not None:
-                        self.params[channel].child("readings", "tec_i").setValue(
-                            settings["tec_i"] * 1000
+                )
+                if settings["tec_i"] is not None:
+                    readings.append(
+                        (
+                            ("readings", "tec_i"),
+                            _to_display(("readings", "tec_i"), settings["tec_i"]),
                         )
-
-    @pyqtSlot(list)
-    def update_thermistor(self, sh_data):
-        for sh_param in sh_data:
-            channel = sh_param["channel"]
-            with QSignalBlocker(self.params[channel]):
-                self._handleCachedSettings(channel, sh_param["params"]["t0"]-273.15, ("thermistor", "t0"))
+                    )
+            prepared.append(
+                (settings["channel"], control_method, settings["i_set"], readings)
+            )
+        return prepared
+
+    @pyqtSlot(object)
+    def update_report(self, args):
+        (report_data,) = args
+        prepared = self._prepare_report(report_data)
+        with self._signals_blocked(entry[0] for entry in prepared):
+            for channel, control_method, i_set, readings in prepared:
+                self._setIfChanged(
+                    self._p(channel, "output", "control_method"), control_method
+                )
+                self._currentCurrent[channel] = i_set
+                self._handleCachedSettings(channel, i_set, ("output", "control_method", "i_set"))
+                for path, value in readings:
+                    self._setIfChanged(self._p(channel, *path), value)
+
+    @pyqtSlot(object)
+    def update_thermistor(self, args):
+        (sh_data,) = args
+        with self._signals_blocked(s["channel"] for s in sh_data):
+            for sh_param in sh_data:
+                channel = sh_param["channel"]
+                self._handleCachedSettings(channel, sh_param["params"]["t0"], ("thermistor", "t0"))
                 self._handleCachedSettings(channel, sh_param["params"]["r0"], ("thermistor", "r0"))
                 self._handleCachedSettings(channel, sh_param["params"]["b"], ("thermistor", "b"))
 
-    @pyqtSlot(list)
-    def update_output(self, output_data):
-        for output_params in output_data:
-            channel = output_params["channel"]
-            with QSignalBlocker(self.params[channel]):
+    @pyqtSlot(object)
+    def update_output(self, args):
+        (output_data,) = args
+        with self._signals_blocked(p["channel"] for p in output_data):
+            for output_params in output_data:
+                channel = output_params["channel"]
                 self._handleCachedSettings(channel, output_params["max_v"], ("output", "limits", "max_v"))
-                self._handleCachedSettings(channel, output_params["max_i_pos"]*1000, ("output", "limits", "max_i_pos"))
-                self._handleCachedSettings(channel, output_params["max_i_neg"]*1000, ("output", "limits", "max_i_neg"))
-
-    @pyqtSlot(list)
-    def update_postfilter(self, postfilter_data):
-        for postfilter_params in postfilter_data:
-            channel = postfilter_params["channel"]
-            with QSignalBlocker(self.params[channel]):
+                self._handleCachedSettings(channel, output_params["max_i_pos"], ("output", "limits", "max_i_pos"))
+                self._handleCachedSettings(channel, output_params["max_i_neg"], ("output", "limits", "max_i_neg"))
+
+    @pyqtSlot(object)
+    def update_postfilter(self, args):
+        (postfilter_data,) = args
+        with self._signals_blocked(p["channel"] for p in postfilter_data):
+            for postfilter_params in postfilter_data:
+                channel = postfilter_params["channel"]
                 self._handleCachedSettings(channel, postfilter_params["rate"], ("thermistor", "rate"))
                 # self.params[channel].child("thermistor", "rate").setValue(
                 #     postfilter_params["rate"]
                 # )
 
+    @pyqtSlot(int, object)
     def update_pid_autotune(self, ch, state):
+        self.ensure_channel(ch)
         match state:
             case PIDAutotuneState.OFF:
                 self.change_params_title(ch, ("pid", "pid_autotune", "run_pid"), "Run")
@@ -284,7 +503,13 @@ class CtrlPanel(QObject):
                     f"Channel {ch} PID Autotune has failed.",
                 )
 
-    @asyncSlot()
+    @asyncSlot(object)
+    async def _on_run_pid_activated(self, param):
+        # one shared slot for every channel's run button; the channel
+        # is read off the activated parameter instead of a per-channel
+        # partial closure
+        await self.pid_auto_tune_request(param.channel)
+
     async def pid_auto_tune_request(self, ch=0):
         match self.autotuners.get_state(ch):
             case PIDAutotuneState.OFF | PIDAutotuneState.FAILED:
@@ -6,9 +6,24 @@ class InfoBox(QtWidgets.QMessageBox):
     def __init__(self):
         super().__init__()
         self.setIcon(QtWidgets.QMessageBox.Icon.Information)
+        # latest-wins queue: while the box is open, new messages
+        # replace the pending one instead of churning the open dialog
+        self._pending = None
+        self.finished.connect(self._on_finished)
 
     @pyqtSlot(str, str)
     def display_info_box(self, title, text):
+        if self.isVisible():
+            if (title, text) != (self.windowTitle(), self.text()):
+                self._pending = (title, text)
+            return
         self.setWindowTitle(title)
         self.setText(text)
         self.show()
+
+    @pyqtSlot(int)
+    def _on_finished(self, _result):
+        if self._pending is not None:
+            title, text = self._pending
+            self._pending = None
+            self.display_info_box(title, text)
@@ -1,5 +1,8 @@
-from collections import deque
-from PyQt6.QtCore import QObject, pyqtSlot
+import time
+
+import numpy as np
+from PyQt6.QtCore import QObject, Qt, pyqtSlot
+from PyQt6.QtGui import QGuiApplication
 from pglive.sources.data_connector import DataConnector
 from pglive.kwargs import Axis
 from pglive.sources.live_plot import LiveLinePlot
@@ -8,7 +11,103 @@ import pyqtgraph as pg
 from pythermostat.gui.model.thermostat import ThermostatConnectionState
 
 
-pg.setConfigOptions(antialias=True)
+# antialiased line drawing forces QPainter onto its slow path and can
+# dominate paint time for streaming plots; aliased traces are fine at
+# the sample densities we draw
+pg.setConfigOptions(antialias=False)
+
+
+class _RingBufferDataConnector(DataConnector):
+    """DataConnector backed by preallocated numpy ring buffers
+
+    The stock connector stores samples in deques and re-materializes
+    them as an ndarray on every plot update. Keeping the history in
+    contiguous float64 storage makes the append path a pair of array
+    writes and hands the plot a view (or one memcpy when the buffer has
+    wrapped) instead of a per-sample Python object walk.
+    """
+
+    def __init__(self, plot, max_points, **kwargs):
+        super().__init__(plot, max_points=max_points, **kwargs)
+        self.paint_enabled = True
+        self._allocate(int(max_points))
+
+    def _allocate(self, capacity):
+        self._x_ring = np.empty(capacity)
+        self._y_ring = np.empty(capacity)
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+        self._sync_views()
+
+    def _sync_views(self):
+        # x and y are what the base class emits to the plot; keep them
+        # as ndarrays so its np.asarray call is free
+        if self._count < self._capacity:
+            self.x = self._x_ring[:self._count]
+            self.y = self._y_ring[:self._count]
+        else:
+            head = self._head
+            self.x = np.concatenate((self._x_ring[head:], self._x_ring[:head]))
+            self.y = np.concatenate((self._y_ring[head:], self._y_ring[:head]))
+
+    def cb_append_data_point(self, y, x=None, **kwargs):
+        """Append new data point"""
+        if self._skip_update():
+            return
+
+        with self.data_lock:
+            if x is None:
+                x = self._x_ring[self._head - 1] + 1 if self._count else 0
+            self._x_ring[self._head] = x
+            self._y_ring[self._head] = y
+            self._head = (self._head + 1) % self._capacity
+            if self._count < self._capacity:
+                self._count += 1
+            self._sync_views()
+            self.last_update = time.perf_counter()
+
+            if self.paint_enabled and not self._skip_plot():
+                self._update_data(**kwargs)
+                self.sig_data_roll_tick.emit(self, self.rolling_index)
+                self.rolling_index += 1
+
+    def clear(self):
+        """Clear all data"""
+        with self.data_lock:
+            self._head = 0
+            self._count = 0
+            self._sync_views()
+            self.rolling_index = 0
+            self.tick_position_indexes = None
+            self.sig_clear.emit()
+            self.sig_data_roll_tick.emit(self, 0)
+
+    def set_paint_enabled(self, enabled):
+        """Toggle plot refreshes without touching the sample stream
+
+        Appends keep landing in the ring while painting is off; one
+        refresh on re-enable catches the plot up.
+        """
+        with self.data_lock:
+            self.paint_enabled = enabled
+            if enabled and self._count:
+                self._update_data()
+
+    def set_capacity(self, capacity):
+        """Resize the ring, keeping the newest samples that fit"""
+        capacity = int(capacity)
+        with self.data_lock:
+            keep = min(self._count, capacity)
+            x_keep = self.x[len(self.x) - keep:].copy()
+            y_keep = self.y[len(self.y) - keep:].copy()
+            self.max_points = capacity
+            self._allocate(capacity)
+            self._x_ring[:keep] = x_keep
+            self._y_ring[:keep] = y_keep
+            self._head = keep % capacity
+            self._count = keep
+            self._sync_views()
 
 
 class LiveDataPlotter(QObject):
@@ -25,20 +124,32 @@ class LiveDataPlotter(QObject):
         self.NUM_CHANNELS = len(live_plots)
         self.graphs = []
 
+        # redrawing plots for a hidden application is wasted work, but
+        # samples are still collected; only the paint is suspended
+        self._suspended = False
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(
+                self._on_application_state_changed
+            )
+
         for i, live_plot in enumerate(live_plots):
             live_plot[0].setTitle(f"Channel {i} Temperature")
             live_plot[1].setTitle(f"Channel {i} Current")
             self.graphs.append(_TecGraphs(live_plot[0], live_plot[1]))
 
+        # bound methods resolved once; the telemetry slots dispatch per
+        # sample and need not re-do the index + attribute lookup
+        self._report_fns = [graph.update_report for graph in self.graphs]
+        self._pid_fns = [graph.update_pid for graph in self.graphs]
+
     @pyqtSlot(ThermostatConnectionState)
     def thermostat_state_change_handler(self, state):
         if state == ThermostatConnectionState.DISCONNECTED:
             self.clear_graphs()
 
     def _config_connector_max_pts(self, connector, samples):
-        connector.max_points = samples
-        connector.x = deque(maxlen=int(connector.max_points))
-        connector.y = deque(maxlen=int(connector.max_points))
+        connector.set_capacity(samples)
 
     @pyqtSlot(int)
     def set_max_samples(self, samples: int):
@@ -52,17 +163,31 @@ class LiveDataPlotter(QObject):
         for graph in self.graphs:
             graph.clear()
 
+    @pyqtSlot(Qt.ApplicationState)
+    def _on_application_state_changed(self, state):
+        # ApplicationInactive merely means another window has focus
+        # while the plots may still be fully visible, so painting only
+        # stops when the platform reports the application hidden or
+        # suspended; telemetry is appended either way so no history is
+        # lost, and re-enabling repaints once to catch up
+        suspended = state in (
+            Qt.ApplicationState.ApplicationSuspended,
+            Qt.ApplicationState.ApplicationHidden,
+        )
+        if suspended != self._suspended:
+            self._suspended = suspended
+            for graph in self.graphs:
+                graph.set_paint_enabled(not suspended)
+
     @pyqtSlot(list)
     def update_pid(self, pid_settings):
         for settings in pid_settings:
-            channel = settings["channel"]
-            self.graphs[channel].update_pid(settings)
+            self._pid_fns[settings["channel"]](settings)
 
     @pyqtSlot(list)
     def update_report(self, report_data):
         for settings in report_data:
-            channel = settings["channel"]
-            self.graphs[channel].update_report(settings)
+            self._report_fns[settings["channel"]](settings)
 
 
 class _TecGraphs:
@@ -70,19 +195,83 @@ class _TecGraphs:
 
     DEFAULT_MAX_SAMPLES = 1000
 
+    # Cap connector-driven redraws; all four curves append within one
+    # event-loop turn, so Qt folds them into one paint per widget, and
+    # the plot rate bounds that paint rate when reports arrive faster
+    # than the display can usefully show.
+    PLOT_RATE = 30
+
     def __init__(self, t_widget, i_widget):
         self._t_widget = t_widget
         self._i_widget = i_widget
 
+        # suspend auto-ranging while the items are assembled; every
+        # addItem/setAxisItems otherwise recomputes the view range
+        for widget in t_widget, i_widget:
+            widget.getPlotItem().disableAutoRange()
+
+        # axis, crosshair and legend wiring is deferred until the
+        # channel's graphs are first shown, so startup only pays for
+        # visible tabs
+        self._setup_done = False
+        for widget in t_widget, i_widget:
+
+            def _showEvent(ev, orig=widget.showEvent):
+                self._finish_setup()
+                orig(ev)
+
+            widget.showEvent = _showEvent
+
         self._t_plot = LiveLinePlot()
         self._i_plot = LiveLinePlot(name="Measured")
         self._iset_plot = LiveLinePlot(name="Set", pen=pg.mkPen("r"))
 
+        # draw cost should track pixel width, not history length:
+        # peak-mode downsampling collapses sub-pixel samples into
+        # min/max pairs and clipToView skips offscreen vertices
+        for plot in self._t_plot, self._i_plot, self._iset_plot:
+            plot.setDownsampling(auto=True, mode="peak")
+            plot.setClipToView(True)
+
         self._t_line = self._t_widget.getPlotItem().addLine(label="{value} °C")
         self._t_line.setVisible(False)
         # Hack for keeping setpoint line in plot range
         self._t_setpoint_plot = LiveLinePlot()
 
+        t_widget.addItem(self._t_plot)
+        t_widget.addItem(self._t_setpoint_plot)
+        i_widget.addItem(self._i_plot)
+        i_widget.addItem(self._iset_plot)
+
+        self.t_connector = _RingBufferDataConnector(
+            self._t_plot, max_points=self.DEFAULT_MAX_SAMPLES, plot_rate=self.PLOT_RATE
+        )
+        self.t_setpoint_connector = DataConnector(
+            self._t_setpoint_plot, max_points=1, plot_rate=self.PLOT_RATE
+        )
+        self.i_connector = _RingBufferDataConnector(
+            self._i_plot, max_points=self.DEFAULT_MAX_SAMPLES, plot_rate=self.PLOT_RATE
+        )
+        self.iset_connector = _RingBufferDataConnector(
+            self._iset_plot, max_points=self.DEFAULT_MAX_SAMPLES, plot_rate=self.PLOT_RATE
+        )
+
+        self.max_samples = self.DEFAULT_MAX_SAMPLES
+        self._last_temp = None
+
+        for widget in t_widget, i_widget:
+            widget.getPlotItem().enableAutoRange()
+
+    def _finish_setup(self):
+        if self._setup_done:
+            return
+        self._setup_done = True
+
+        t_widget = self._t_widget
+        i_widget = self._i_widget
+        for widget in t_widget, i_widget:
+            widget.getPlotItem().disableAutoRange()
+
         for graph in t_widget, i_widget:
             time_axis = LiveAxis(
                 "bottom",
@@ -108,23 +297,8 @@ class _TecGraphs:
         i_widget.setAxisItems({"left": current_axis})
         i_widget.addLegend(brush=(50, 50, 200, 150))
 
-        t_widget.addItem(self._t_plot)
-        t_widget.addItem(self._t_setpoint_plot)
-        i_widget.addItem(self._i_plot)
-        i_widget.addItem(self._iset_plot)
-
-        self.t_connector = DataConnector(
-            self._t_plot, max_points=self.DEFAULT_MAX_SAMPLES
-        )
-        self.t_setpoint_connector = DataConnector(self._t_setpoint_plot, max_points=1)
-        self.i_connector = DataConnector(
-            self._i_plot, max_points=self.DEFAULT_MAX_SAMPLES
-        )
-        self.iset_connector = DataConnector(
-            self._iset_plot, max_points=self.DEFAULT_MAX_SAMPLES
-        )
-
-        self.max_samples = self.DEFAULT_MAX_SAMPLES
+        for widget in t_widget, i_widget:
+            widget.getPlotItem().enableAutoRange()
 
     def plot_append(self, report):
         temperature = report["temperature"]
@@ -152,16 +326,23 @@ class _TecGraphs:
         for connector in self.t_connector, self.i_connector, self.iset_connector:
             connector.clear()
 
+    def set_paint_enabled(self, enabled):
+        for connector in self.t_connector, self.i_connector, self.iset_connector:
+            connector.set_paint_enabled(enabled)
+
     def set_t_line(self, temp=None, visible=None):
         if visible is not None:
             self._t_line.setVisible(visible)
-        if temp is not None:
+        if temp is not None and temp != self._last_temp:
+            self._last_temp = temp
             self._t_line.setValue(temp)
 
             # PyQtGraph normally does not update this text when the line
             # is not visible, so make sure that the temperature label
             # gets updated always, and doesn't stay at an old value.
-            self._t_line.label.setText(f"{temp} °C")
+            # While the line is visible setValue refreshes it natively.
+            if not self._t_line.isVisible():
+                self._t_line.label.setText(f"{temp} °C")
 
     def set_max_samples(self, samples: int):
         for graph in self.graphs:
@@ -62,10 +62,27 @@ class ConnectionDetailsMenu(QtWidgets.QMenu):
             self.thermostat_state_change_handler
         )
 
+        # widgets are built on first use (aboutToShow, or ensure_built
+        # for callers that read the host/port widgets directly); state
+        # updates arriving before that are buffered
+        self._built = False
+        self._pending_state = None
+        self.aboutToShow.connect(self.ensure_built)
+
+    def ensure_built(self):
+        if self._built:
+            return
+        self._built = True
         self._setup_menu_items()
+        if self._pending_state is not None:
+            state, self._pending_state = self._pending_state, None
+            self.thermostat_state_change_handler(state)
 
     @pyqtSlot(ThermostatConnectionState)
     def thermostat_state_change_handler(self, state):
+        if not self._built:
+            self._pending_state = state
+            return
         self.host_set_line.setEnabled(state == ThermostatConnectionState.DISCONNECTED)
         self.port_set_spin.setEnabled(state == ThermostatConnectionState.DISCONNECTED)
 
@@ -122,18 +139,28 @@ class ConnectionDetailsMenu(QtWidgets.QMenu):
 class PlotOptionsMenu(QtWidgets.QMenu):
     def __init__(self, channel_graphs, max_samples=1000):
         super().__init__()
+        self._channel_graphs = channel_graphs
+        self._max_samples = max_samples
+
+        self._built = False
+        self.aboutToShow.connect(self._ensure_built)
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
 
         # Clears plots for both graphs in all channels
         clear_graphs = QtGui.QAction("Clear graphs", self)
-        clear_graphs.triggered.connect(channel_graphs.clear_graphs)
+        clear_graphs.triggered.connect(self._channel_graphs.clear_graphs)
         self.addAction(clear_graphs)
 
         # Set maximum samples in graphs
         samples_spinbox = QtWidgets.QSpinBox()
         samples_spinbox.setRange(2, 100000)
         samples_spinbox.setSuffix(" samples")
-        samples_spinbox.setValue(max_samples)
-        samples_spinbox.valueChanged.connect(channel_graphs.set_max_samples)
+        samples_spinbox.setValue(self._max_samples)
+        samples_spinbox.valueChanged.connect(self._channel_graphs.set_max_samples)
 
         limit_samples = QtWidgets.QWidgetAction(self)
         limit_samples.setDefaultWidget(samples_spinbox)
@@ -141,53 +168,130 @@ class PlotOptionsMenu(QtWidgets.QMenu):
 
 
 class ThermostatSettingsMenu(QtWidgets.QMenu):
+    # compiled once; filled in with a flat mapping when the dialog opens
+    _ABOUT_TEMPLATE = """
+        <h1>Sinara 8451 Thermostat v{rev_major}.{rev_minor}</h1>
+
+        <br>
+
+        <h2>Settings:</h2>
+        Default fan curve:
+            a = {fan_k_a},
+            b = {fan_k_b},
+            c = {fan_k_c}
+        <br>
+        Fan PWM range:
+            {min_fan_pwm} \u2013 {max_fan_pwm}
+        <br>
+        Fan PWM frequency: {fan_pwm_freq_hz} Hz
+        <br>
+        Fan available: {fan_available}
+        <br>
+        Fan PWM recommended: {fan_pwm_recommended}
+        """
+
     def __init__(self, thermostat, info_box, style):
         super().__init__()
         self._thermostat = thermostat
         self._info_box = info_box
-        self._style = style
+        # rasterize the warning icon once instead of round-tripping
+        # through the style engine on every fan update
+        self._warn_pixmap = style.standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_MessageBoxWarning
+        ).pixmap(16, 16)
+        self._empty_pixmap = QtGui.QPixmap()
 
         self.hw_rev_data = {}
         self._thermostat.hw_rev_update.connect(self.hw_rev)
+        self._thermostat.fan_update.connect(self.fan_update)
         self._thermostat.connection_state_update.connect(
             self.thermostat_state_change_handler
         )
 
+        # the fan group and actions are built on first aboutToShow;
+        # telemetry arriving earlier is buffered and replayed then
+        self._built = False
+        self._about_box = None
+        self._pending_fan = None
+        self.aboutToShow.connect(self._ensure_built)
+
+        # collapse slider drags into one set_fan write per idle period;
+        # releasing the slider flushes immediately
+        self._pending_fan_value = None
+        self._fan_debounce = QtCore.QTimer(self)
+        self._fan_debounce.setSingleShot(True)
+        self._fan_debounce.setInterval(100)
+        self._fan_debounce.timeout.connect(self._flush_fan_value)
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
         self._setup_menu_items()
+        if self.hw_rev_data:
+            self.fan_group.setEnabled(self.hw_rev_data["settings"]["fan_available"])
+        if self._pending_fan is not None:
+            fan_settings, self._pending_fan = self._pending_fan, None
+            self.fan_update(fan_settings)
 
     @pyqtSlot("QVariantMap")
     def fan_update(self, fan_settings):
         if fan_settings is None:
             return
-        with QSignalBlocker(self.fan_power_slider):
+        if not self._built:
+            self._pending_fan = fan_settings
+            return
+        # one block/unblock pass over both widgets instead of a blocker
+        # object per write; this runs at the report rate
+        self.fan_power_slider.blockSignals(True)
+        self.fan_auto_box.blockSignals(True)
+        try:
             self.fan_power_slider.setValue(
                 fan_settings["fan_pwm"] or 100  # 0 = PWM off = full strength
             )
-        with QSignalBlocker(self.fan_auto_box):
             self.fan_auto_box.setChecked(fan_settings["auto_mode"])
+        finally:
+            self.fan_power_slider.blockSignals(False)
+            self.fan_auto_box.blockSignals(False)
+
+    @pyqtSlot(int)
+    def _fan_slider_moved(self, value):
+        self._pending_fan_value = value
+        self._fan_debounce.start()
+
+    @pyqtSlot()
+    def _flush_fan_value(self):
+        self._fan_debounce.stop()
+        if self._pending_fan_value is None:
+            return
+        value, self._pending_fan_value = self._pending_fan_value, None
+        self.fan_set_request(value)
 
     def set_fan_pwm_warning(self):
         if self.fan_power_slider.value() != 100:
-            pixmapi = getattr(QtWidgets.QStyle.StandardPixmap, "SP_MessageBoxWarning")
-            icon = self._style.standardIcon(pixmapi)
-            self.fan_pwm_warning.setPixmap(icon.pixmap(16, 16))
+            self.fan_pwm_warning.setPixmap(self._warn_pixmap)
             self.fan_pwm_warning.setToolTip(
                 "Throttling the fan (not recommended on this hardware rev)"
             )
         else:
-            self.fan_pwm_warning.setPixmap(QtGui.QPixmap())
+            self.fan_pwm_warning.setPixmap(self._empty_pixmap)
             self.fan_pwm_warning.setToolTip("")
 
     @pyqtSlot(ThermostatConnectionState)
     def thermostat_state_change_handler(self, state):
         if state == ThermostatConnectionState.DISCONNECTED:
-            self.fan_pwm_warning.setPixmap(QtGui.QPixmap())
-            self.fan_pwm_warning.setToolTip("")
+            self._pending_fan = None
+            self._fan_debounce.stop()
+            self._pending_fan_value = None
+            if self._built:
+                self.fan_pwm_warning.setPixmap(self._empty_pixmap)
+                self.fan_pwm_warning.setToolTip("")
 
     @pyqtSlot("QVariantMap")
     def hw_rev(self, hw_rev):
         self.hw_rev_data = hw_rev
-        self.fan_group.setEnabled(self.hw_rev_data["settings"]["fan_available"])
+        if self._built:
+            self.fan_group.setEnabled(self.hw_rev_data["settings"]["fan_available"])
 
     @asyncSlot(int)
     async def fan_set_request(self, value):
@@ -257,36 +361,24 @@ class ThermostatSettingsMenu(QtWidgets.QMenu):
         self.ipv4_action.triggered.connect(self.net_settings_request)
         self.addAction(self.ipv4_action)
 
-        def about_thermostat():
-            QtWidgets.QMessageBox.about(
-                self,
-                "About Thermostat",
-                f"""
-                <h1>Sinara 8451 Thermostat v{self.hw_rev_data['rev']['major']}.{self.hw_rev_data['rev']['minor']}</h1>
-
-                <br>
-
-                <h2>Settings:</h2>
-                Default fan curve:
-                    a = {self.hw_rev_data['settings']['fan_k_a']},
-                    b = {self.hw_rev_data['settings']['fan_k_b']},
-                    c = {self.hw_rev_data['settings']['fan_k_c']}
-                <br>
-                Fan PWM range:
-                    {self.hw_rev_data['settings']['min_fan_pwm']} \u2013 {self.hw_rev_data['settings']['max_fan_pwm']}
-                <br>
-                Fan PWM frequency: {self.hw_rev_data['settings']['fan_pwm_freq_hz']} Hz
-                <br>
-                Fan available: {self.hw_rev_data['settings']['fan_available']}
-                <br>
-                Fan PWM recommended: {self.hw_rev_data['settings']['fan_pwm_recommended']}
-                """,
-            )
-
         self.about_action = QtGui.QAction("About Thermostat", self)
-        self.about_action.triggered.connect(about_thermostat)
+        self.about_action.triggered.connect(self._about_thermostat)
         self.addAction(self.about_action)
 
+    def _about_thermostat(self):
+        mapping = dict(self.hw_rev_data["settings"])
+        mapping["rev_major"] = self.hw_rev_data["rev"]["major"]
+        mapping["rev_minor"] = self.hw_rev_data["rev"]["minor"]
+
+        # reuse one dialog instead of constructing and styling a fresh
+        # QMessageBox.about modal per click
+        if self._about_box is None:
+            self._about_box = QtWidgets.QMessageBox(self)
+            self._about_box.setWindowTitle("About Thermostat")
+            self._about_box.setIcon(QtWidgets.QMessageBox.Icon.Information)
+        self._about_box.setText(self._ABOUT_TEMPLATE.format_map(mapping))
+        self._about_box.exec()
+
     def _setup_fan_group(self):
         # Fan settings
         self.fan_group = QtWidgets.QWidget()
@@ -318,9 +410,9 @@ class ThermostatSettingsMenu(QtWidgets.QMenu):
         self.fan_pwm_warning.setMinimumSize(QtCore.QSize(16, 0))
         fan_layout.addWidget(self.fan_pwm_warning)
 
-        self.fan_power_slider.valueChanged.connect(self.fan_set_request)
+        self.fan_power_slider.valueChanged.connect(self._fan_slider_moved)
+        self.fan_power_slider.sliderReleased.connect(self._flush_fan_value)
         self.fan_auto_box.stateChanged.connect(self.fan_auto_set_request)
-        self._thermostat.fan_update.connect(self.fan_update)
 
         fan_label.setToolTip("Adjust the fan")
         fan_label.setText("Fan:")
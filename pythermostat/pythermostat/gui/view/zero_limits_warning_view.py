@@ -8,27 +8,30 @@ class ZeroLimitsWarningView(QObject):
         self._thermostat = thermostat
         self._thermostat.output_update.connect(self.set_limits_warning)
         self._lbl = limit_warning
-        self._style = style
-
-    @pyqtSlot(list)
-    def set_limits_warning(self, output_data: list):
-        channels_zeroed_limits = [set() for i in range(self._thermostat.NUM_CHANNELS)]
-
-        for output_params in output_data:
-            channel = output_params["channel"]
-            for limit in "max_i_pos", "max_i_neg", "max_v":
-                if output_params[limit] == 0.0:
-                    channels_zeroed_limits[channel].add(limit)
-
-        channel_disabled = [False, False]
+        # rasterize the warning icon once instead of round-tripping
+        # through the style engine on every output update
+        self._warn_pixmap = style.standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_MessageBoxWarning
+        ).pixmap(16, 16)
+        self._empty_pixmap = QtGui.QPixmap()
+        self._last_key = None
+
+    @staticmethod
+    def _zeroed_limits(output_data):
+        channel_disabled = [False] * len(output_data)
         report_str = "The following output limit(s) are set to zero:\n"
-        for ch, zeroed_limits in enumerate(channels_zeroed_limits):
-            if {"max_i_pos", "max_i_neg"}.issubset(zeroed_limits):
+        for output_params in output_data:
+            ch = output_params["channel"]
+            currents_zeroed = (
+                output_params["max_i_pos"] == 0.0
+                and output_params["max_i_neg"] == 0.0
+            )
+            if currents_zeroed:
                 report_str += "Max Cooling Current, Max Heating Current"
                 channel_disabled[ch] = True
 
-            if "max_v" in zeroed_limits:
-                if channel_disabled[ch]:
+            if output_params["max_v"] == 0.0:
+                if currents_zeroed:
                     report_str += ", "
                 report_str += "Max Voltage Difference"
                 channel_disabled[ch] = True
@@ -39,12 +42,21 @@ class ZeroLimitsWarningView(QObject):
         report_str += (
             "\nThese limit(s) are restricting the channel(s) from producing current."
         )
+        return tuple(channel_disabled), report_str
+
+    @pyqtSlot(list)
+    def set_limits_warning(self, output_data: list):
+        key = self._zeroed_limits(output_data)
+        # label writes invalidate the style and schedule repaints, so
+        # skip them while the derived warning state is unchanged
+        if key == self._last_key:
+            return
+        self._last_key = key
+        channel_disabled, report_str = key
 
         if True in channel_disabled:
-            pixmapi = getattr(QtWidgets.QStyle.StandardPixmap, "SP_MessageBoxWarning")
-            icon = self._style.standardIcon(pixmapi)
-            self._lbl.setPixmap(icon.pixmap(16, 16))
+            self._lbl.setPixmap(self._warn_pixmap)
             self._lbl.setToolTip(report_str)
         else:
-            self._lbl.setPixmap(QtGui.QPixmap())
+            self._lbl.setPixmap(self._empty_pixmap)
             self._lbl.setToolTip(None)
@@ -1,8 +1,6 @@
-import time
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from threading import Thread, Lock
 from pythermostat.client import Client
 
 
@@ -14,21 +12,43 @@ def main():
     print("Channel 0 target temperature: {:.3f}".format(target_temperature))
 
     class Series:
+        # fixed-offset attribute storage; "plot" is the line artist
+        # attached after ax.plot()
+        __slots__ = ("conv", "_x", "_y", "n", "plot")
+
         def __init__(self, conv=lambda x: x):
             self.conv = conv
-            self.x_data = []
-            self.y_data = []
+            self._x = np.empty(256)
+            self._y = np.empty(256)
+            self.n = 0
+
+        @property
+        def x_data(self):
+            return self._x[:self.n]
+
+        @property
+        def y_data(self):
+            return self._y[:self.n]
 
         def append(self, x, y):
-            self.x_data.append(x)
-            self.y_data.append(self.conv(y))
+            if self.n == len(self._x):
+                # grow by doubling for amortized O(1) appends
+                self._x = np.resize(self._x, 2 * self.n)
+                self._y = np.resize(self._y, 2 * self.n)
+            self._x[self.n] = x
+            self._y[self.n] = self.conv(y)
+            self.n += 1
 
         def clip(self, min_x):
-            drop = 0
-            while drop < len(self.x_data) and self.x_data[drop] < min_x:
-                drop += 1
-            self.x_data = self.x_data[drop:]
-            self.y_data = self.y_data[drop:]
+            # timestamps are monotonic, so the cutoff is a binary
+            # search and the survivors one contiguous move instead of
+            # a per-element scan plus list reallocation
+            drop = int(np.searchsorted(self._x[:self.n], min_x))
+            if drop:
+                keep = self.n - drop
+                self._x[:keep] = self._x[drop:self.n]
+                self._y[:keep] = self._y[drop:self.n]
+                self.n = keep
 
     series = {
         # 'adc': Series(),
@@ -44,93 +64,84 @@ def main():
         'tec_u_meas': Series(),
         # 'interval': Series(),
     }
-    series_lock = Lock()
-
-    quit = False
-
-    def recv_data(thermostat):
-        global last_packet_time
-        while True:
-            data = thermostat.get_report()
-            ch0 = data[0]
-            series_lock.acquire()
-            try:
-                for k, s in series.items():
-                    if k in ch0:
-                        v = ch0[k]
-                        if type(v) is float:
-                            s.append(ch0['time'], v)
-            finally:
-                series_lock.release()
-
-            if quit:
-                break
-            time.sleep(0.05)
-
-    thread = Thread(target=recv_data, args=(thermostat,))
-    thread.start()
+    # frozen (key, series) pairs so the poll loop below does not
+    # rebuild the dict view on every sample
+    series_items = tuple(series.items())
+
+    # polled from the animation timer, so everything stays on one
+    # thread and the series need no locking
+    def poll_report():
+        data = thermostat.get_report()
+        ch0 = data[0]
+        t = ch0['time']
+        for k, s in series_items:
+            v = ch0.get(k)
+            if v.__class__ is float:
+                s.append(t, v)
 
     fig, ax = plt.subplots()
 
     for k, s in series.items():
         s.plot, = ax.plot([], [], label=k)
+    # the legend is built once and its text artists are updated in
+    # place each frame instead of being destroyed and recreated
     legend = ax.legend()
+    legend_texts = legend.get_texts()
+    artists = tuple(s.plot for s in series.values()) + (legend,)
+
+    last_xlim = [None]
+    last_ylim = [None]
 
     def animate(i):
+        poll_report()
+
         min_x, max_x, min_y, max_y = None, None, None, None
-        
-        series_lock.acquire()
-        try:
-            for k, s in series.items():
-                s.plot.set_data(s.x_data, s.y_data)
-                if len(s.y_data) > 0:
-                    s.plot.set_label("{}: {:.3f}".format(k, s.y_data[-1]))
-
-                if len(s.x_data) > 0:
-                    min_x_ = min(s.x_data)
-                    if min_x is None:
-                        min_x = min_x_
-                    else:
-                        min_x = min(min_x, min_x_)
-                    max_x_ = max(s.x_data)
-                    if max_x is None:
-                        max_x = max_x_
-                    else:
-                        max_x = max(max_x, max_x_)
-                if len(s.y_data) > 0:
-                    min_y_ = min(s.y_data)
-                    if min_y is None:
-                        min_y = min_y_
-                    else:
-                        min_y = min(min_y, min_y_)
-                    max_y_ = max(s.y_data)
-                    if max_y is None:
-                        max_y = max_y_
-                    else:
-                        max_y = max(max_y, max_y_)
-
-            if min_x and max_x - TIME_WINDOW > min_x:
-                for s in series.values():
-                    s.clip(max_x - TIME_WINDOW)
-        finally:
-            series_lock.release()
-
-        if min_x != max_x:
+
+        for text, (k, s) in zip(legend_texts, series.items()):
+            if s.n == 0:
+                continue
+            x = s.x_data
+            y = s.y_data
+            s.plot.set_data(x, y)
+            text.set_text("{}: {:.3f}".format(k, y[-1]))
+
+            # x is monotonic, so its extrema are the end points;
+            # y takes one vectorized reduction each
+            min_x = x[0] if min_x is None else min(min_x, x[0])
+            max_x = x[-1] if max_x is None else max(max_x, x[-1])
+            min_y_ = y.min()
+            min_y = min_y_ if min_y is None else min(min_y, min_y_)
+            max_y_ = y.max()
+            max_y = max_y_ if max_y is None else max(max_y, max_y_)
+
+        if min_x and max_x - TIME_WINDOW > min_x:
+            for s in series.values():
+                s.clip(max_x - TIME_WINDOW)
+
+        # blitting only repaints the returned artists; the tick labels
+        # live outside the blit region, so request a full redraw on the
+        # frames where the limits actually move
+        limits_changed = False
+        if min_x != max_x and (min_x, max_x) != last_xlim[0]:
+            last_xlim[0] = (min_x, max_x)
             ax.set_xlim(min_x, max_x)
+            limits_changed = True
         if min_y != max_y:
             margin_y = 0.01 * (max_y - min_y)
-            ax.set_ylim(min_y - margin_y, max_y + margin_y)
+            ylim = (min_y - margin_y, max_y + margin_y)
+            if ylim != last_ylim[0]:
+                last_ylim[0] = ylim
+                ax.set_ylim(*ylim)
+                limits_changed = True
+        if limits_changed:
+            fig.canvas.draw_idle()
 
-        nonlocal legend
-        legend.remove()
-        legend = ax.legend()
+        return artists
 
     ani = animation.FuncAnimation(
-        fig, animate, interval=1, blit=False, save_count=50)
+        fig, animate, interval=33, blit=True, cache_frame_data=False)
 
     plt.show()
-    quit = True
-    thread.join()
 
 
 if __name__ == "__main__":
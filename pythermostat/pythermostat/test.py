@@ -1,10 +1,24 @@
 import argparse
 from contextlib import contextmanager
+from types import MappingProxyType
 from pythermostat.client import Client
 
 
 CHANNELS = 2
 
+# output fields the test overwrites and must restore afterwards
+_OUTPUT_FIELDS = ("max_i_pos", "max_i_neg", "max_v", "i_set", "polarity")
+
+# settings applied during the current check; read-only so a run cannot
+# accidentally mutate the shared mapping
+_TEST_OUTPUT_SETTINGS = MappingProxyType({
+    "max_i_pos": 2,
+    "max_i_neg": 2,
+    "max_v": 4,
+    "i_set": 0.1,
+    "polarity": "normal",
+})
+
 
 def get_argparser():
     parser = argparse.ArgumentParser(description="Thermostat hardware testing script")
@@ -15,14 +29,21 @@ def get_argparser():
         "-r",
         "--testing_resistance",
         default=10_000,
+        type=float,
         help="Testing resistance value through SENS pin in Ohms",
     )
     parser.add_argument(
         "-d",
         "--deviation",
         default=1,
+        type=float,
         help="Allowed deviation of resistance in percentage",
     )
+    parser.add_argument(
+        "--allow-floating-sens",
+        action="store_true",
+        help="Run the output test even when the SENS input is floating",
+    )
 
     return parser
 
@@ -36,30 +57,38 @@ def main():
     print(min_allowed_resistance, max_allowed_resistance)
 
     thermostat = Client(args.host, args.port)
+    # one pipelined fetch serves every channel below instead of
+    # re-querying the device inside the loop
+    conf = thermostat.get_all_conf(("report", "output"))
+    report = conf["report"]
+    outputs = conf["output"]
     for channel in range(CHANNELS):
         print(f"Channel {channel} is active")
 
-        print("Checking resistance through SENS input ....", end=" ")
-        sens_resistance = thermostat.get_report()[channel]["sens"]
+        sens_resistance = report[channel]["sens"]
         if sens_resistance is not None:
-            print(sens_resistance, "Ω")
             if min_allowed_resistance <= sens_resistance <= max_allowed_resistance:
-                print("PASSED")
+                verdict = "PASSED"
             else:
-                print("FAILED")
+                verdict = "FAILED"
+            print(
+                "Checking resistance through SENS input ...."
+                f" {sens_resistance} Ω\n{verdict}"
+            )
         else:
-            print("Floating SENS input! Is the channel connected?")
-
-        with preserve_thermostat_output_settings(thermostat, channel):
-            test_output_settings = {
-                "max_i_pos": 2,
-                "max_i_neg": 2,
-                "max_v": 4,
-                "i_set": 0.1,
-                "polarity": "normal",
-            }
-            for field, value in test_output_settings.items():
-                thermostat.set_param("output", channel, field, value)
+            print(
+                "Checking resistance through SENS input ...."
+                " Floating SENS input! Is the channel connected?"
+            )
+            if not args.allow_floating_sens:
+                # a disconnected channel cannot pass the current check;
+                # skip the prompts and the output round-trips
+                print(f"Skipping output test for channel {channel}.")
+                print()
+                continue
+
+        with preserve_thermostat_output_settings(thermostat, channel, outputs[channel]):
+            thermostat.set_params("output", channel, _TEST_OUTPUT_SETTINGS)
 
             input(f"Check if channel {channel} current = 0.1 A, and press ENTER...")
 
@@ -70,11 +99,17 @@ def main():
 
 
 @contextmanager
-def preserve_thermostat_output_settings(client, channel):
-    original_output_settings = client.get_output()[channel]
+def preserve_thermostat_output_settings(client, channel, original_output_settings):
     yield original_output_settings
-    for setting in "max_i_pos", "max_i_neg", "max_v", "i_set", "polarity":
-        client.set_param("output", channel, setting, original_output_settings[setting])
+    # only write back the fields the test configuration actually
+    # changed; a unit already in the test state needs no restore
+    restore = {
+        setting: original_output_settings[setting]
+        for setting in _OUTPUT_FIELDS
+        if _TEST_OUTPUT_SETTINGS.get(setting) != original_output_settings[setting]
+    }
+    if restore:
+        client.set_params("output", channel, restore)
 
 
 if __name__ == "__main__":